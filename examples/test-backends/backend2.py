@@ -1,56 +1,130 @@
 #!/usr/bin/env python3
 
-import json
-import time
+import multiprocessing
+import orjson
+import os
+import signal
+import socket
+import sys
+import uvicorn
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
-
-class BackendHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == '/health':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            response = {
-                'status': 'healthy',
-                'server': 'backend-2'
-            }
-            self.wfile.write(json.dumps(response).encode())
-            
-        elif self.path == '/api/users':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            users = [
-                {'id': 3, 'name': 'Bob Johnson', 'server': 'backend-2'},
-                {'id': 4, 'name': 'Alice Brown', 'server': 'backend-2'}
+from fastapi import FastAPI
+from fastapi.responses import Response
+
+# Static response bodies, serialized once at import
+HEALTH_BODY = orjson.dumps({
+    'status': 'healthy',
+    'server': 'backend-2'
+})
+USERS_BODY = orjson.dumps([
+    {'id': 3, 'name': 'Bob Johnson', 'server': 'backend-2'},
+    {'id': 4, 'name': 'Alice Brown', 'server': 'backend-2'}
+])
+
+def json_messages(body):
+    """Build the complete ASGI response messages for a static JSON body"""
+    return (
+        {
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode())
             ]
-            self.wfile.write(json.dumps(users).encode())
-            
-        else:
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            response = {
-                'server': 'Backend Server 2',
-                'timestamp': datetime.now().isoformat(),
-                'message': 'Hello from Python backend server 2!',
-                'port': '3002'
-            }
-            self.wfile.write(json.dumps(response).encode())
-            
-        print(f"Request handled by backend 2 - {self.command} {self.path}")
-    
-    def log_message(self, format, *args):
-        # Suppress default logging
+        },
+        {'type': 'http.response.body', 'body': body}
+    )
+
+STATIC_RESPONSES = {
+    '/health': json_messages(HEALTH_BODY),
+    '/api/users': json_messages(USERS_BODY)
+}
+
+app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+
+@app.get('/{path:path}')
+async def index(path: str):
+    response = {
+        'server': 'Backend Server 2',
+        'timestamp': datetime.now(),
+        'message': 'Hello from Python backend server 2!',
+        'port': '3002'
+    }
+    return Response(orjson.dumps(response), media_type='application/json')
+
+async def static_app(scope, receive, send):
+    """Answer static routes from prebuilt messages, skipping FastAPI routing"""
+    if scope['type'] == 'http' and scope['method'] == 'GET':
+        messages = STATIC_RESPONSES.get(scope['path'])
+        if messages:
+            for message in messages:
+                await send(message)
+            return
+    await app(scope, receive, send)
+
+# Only Linux load-balances connections across SO_REUSEPORT sockets
+REUSE_PORT = sys.platform.startswith('linux')
+
+def port_in_use(port):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        return probe.connect_ex(('localhost', port)) == 0
+
+def bind_socket(port):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if REUSE_PORT:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind(('localhost', port))
+    return sock
+
+def serve(sock):
+    # Outlast the proxy's 30s upstream idle pool so the proxy, not the backend,
+    # is always the side that closes an idle keep-alive connection
+    config = uvicorn.Config(static_app, loop='uvloop', http='httptools', log_level='warning',
+                            timeout_keep_alive=45)
+    try:
+        uvicorn.Server(config).run(sockets=[sock])
+    except KeyboardInterrupt:
         pass
 
 if __name__ == '__main__':
     port = 3002
-    server = HTTPServer(('localhost', port), BackendHandler)
-    print(f"Backend Server 2 starting on port {port}")
+    workers = os.cpu_count() or 1
+
+    # SO_REUSEPORT would let a second instance silently share the port
+    if port_in_use(port):
+        print(f"Backend Server 2 cannot start: port {port} is already in use")
+        sys.exit(1)
+
+    # On Linux each worker gets its own SO_REUSEPORT socket so the kernel spreads
+    # connections across worker accept queues; elsewhere workers share one socket
     try:
-        server.serve_forever()
-    except KeyboardInterrupt:
-        print("\nBackend Server 2 stopped")
-        server.shutdown()
\ No newline at end of file
+        if REUSE_PORT:
+            sockets = [bind_socket(port) for _ in range(workers)]
+        else:
+            sockets = [bind_socket(port)] * workers
+    except OSError as e:
+        print(f"Backend Server 2 cannot bind port {port}: {e}")
+        sys.exit(1)
+
+    print(f"Backend Server 2 starting on port {port} with {workers} worker{'s' if workers != 1 else ''}")
+    processes = [multiprocessing.Process(target=serve, args=(sock,)) for sock in sockets]
+    for process in processes:
+        process.start()
+
+    def stop(signum, frame):
+        # Forward shutdown to the workers so none outlive the parent
+        for process in processes:
+            process.terminate()
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    for process in processes:
+        process.join()
+
+    # A worker killed by the SIGTERM we forwarded is a normal shutdown
+    failed = [process for process in processes if process.exitcode not in (0, -signal.SIGTERM)]
+    if failed:
+        print(f"\nBackend Server 2 stopped: worker exit codes {[process.exitcode for process in failed]}")
+        sys.exit(1)
+    print("\nBackend Server 2 stopped")
\ No newline at end of file
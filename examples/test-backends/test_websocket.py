@@ -8,10 +8,10 @@ and sending various types of messages.
 
 import asyncio
 import websockets
-import json
+import orjson
 import sys
+import time
 import argparse
-from datetime import datetime
 
 async def test_websocket_backend(uri, verbose=False):
     """
@@ -20,12 +20,12 @@ async def test_websocket_backend(uri, verbose=False):
     print(f"Connecting to WebSocket server at {uri}...")
     
     try:
-        async with websockets.connect(uri) as websocket:
+        async with websockets.connect(uri, compression=None) as websocket:
             print("✅ Connected successfully!")
             
             # Listen for welcome message
             welcome_msg = await websocket.recv()
-            welcome_data = json.loads(welcome_msg)
+            welcome_data = orjson.loads(welcome_msg)
             print(f"📨 Welcome message: {welcome_data['message']}")
             if verbose:
                 print(f"   Server info: {welcome_data.get('server_info', {})}")
@@ -36,9 +36,9 @@ async def test_websocket_backend(uri, verbose=False):
                 "type": "ping",
                 "message": "Hello from test client!"
             }
-            await websocket.send(json.dumps(ping_msg))
+            await websocket.send(orjson.dumps(ping_msg), text=True)
             response = await websocket.recv()
-            pong_data = json.loads(response)
+            pong_data = orjson.loads(response)
             
             if pong_data.get('type') == 'pong':
                 print("✅ Ping test successful!")
@@ -53,9 +53,9 @@ async def test_websocket_backend(uri, verbose=False):
                 "type": "echo",
                 "message": "This should be echoed back"
             }
-            await websocket.send(json.dumps(echo_msg))
+            await websocket.send(orjson.dumps(echo_msg), text=True)
             response = await websocket.recv()
-            echo_data = json.loads(response)
+            echo_data = orjson.loads(response)
             
             if echo_data.get('type') == 'echo_response':
                 print("✅ Echo test successful!")
@@ -68,9 +68,9 @@ async def test_websocket_backend(uri, verbose=False):
             # Test 3: Stats request
             print("\n📊 Testing stats request...")
             stats_msg = {"type": "stats"}
-            await websocket.send(json.dumps(stats_msg))
+            await websocket.send(orjson.dumps(stats_msg), text=True)
             response = await websocket.recv()
-            stats_data = json.loads(response)
+            stats_data = orjson.loads(response)
             
             if stats_data.get('type') == 'stats_response':
                 print("✅ Stats test successful!")
@@ -89,9 +89,9 @@ async def test_websocket_backend(uri, verbose=False):
                 "type": "broadcast",
                 "message": "Hello to all connected clients!"
             }
-            await websocket.send(json.dumps(broadcast_msg))
+            await websocket.send(orjson.dumps(broadcast_msg), text=True)
             response = await websocket.recv()
-            broadcast_data = json.loads(response)
+            broadcast_data = orjson.loads(response)
             
             if broadcast_data.get('type') == 'broadcast_confirm':
                 print("✅ Broadcast test successful!")
@@ -107,9 +107,9 @@ async def test_websocket_backend(uri, verbose=False):
                 "type": "invalid_type",
                 "message": "This should return an error"
             }
-            await websocket.send(json.dumps(invalid_msg))
+            await websocket.send(orjson.dumps(invalid_msg), text=True)
             response = await websocket.recv()
-            error_data = json.loads(response)
+            error_data = orjson.loads(response)
             
             if error_data.get('type') == 'error':
                 print("✅ Error handling test successful!")
@@ -123,7 +123,7 @@ async def test_websocket_backend(uri, verbose=False):
             print("\n🔧 Testing invalid JSON...")
             await websocket.send("invalid json string")
             response = await websocket.recv()
-            json_error_data = json.loads(response)
+            json_error_data = orjson.loads(response)
             
             if json_error_data.get('type') == 'error' and 'JSON' in json_error_data.get('message', ''):
                 print("✅ JSON error handling test successful!")
@@ -159,20 +159,26 @@ async def interactive_mode(uri):
     print()
     
     try:
-        async with websockets.connect(uri) as websocket:
+        async with websockets.connect(uri, compression=None) as websocket:
             print("✅ Connected! Waiting for welcome message...")
             
             # Listen for welcome message
             welcome_msg = await websocket.recv()
-            welcome_data = json.loads(welcome_msg)
+            welcome_data = orjson.loads(welcome_msg)
             print(f"📨 {welcome_data['message']}")
             
             # Start background task to listen for messages
             async def listen_for_messages():
+                # Only reformat the timestamp when the second changes
+                last_sec = 0
+                timestamp = ''
                 try:
                     async for message in websocket:
-                        data = json.loads(message)
-                        timestamp = datetime.now().strftime("%H:%M:%S")
+                        data = orjson.loads(message)
+                        sec = int(time.time())
+                        if sec != last_sec:
+                            timestamp = time.strftime("%H:%M:%S", time.localtime(sec))
+                            last_sec = sec
                         print(f"\n[{timestamp}] 📨 {data.get('type', 'unknown')}: {data.get('message', data)}")
                         print("> ", end="", flush=True)
                 except websockets.exceptions.ConnectionClosed:
@@ -195,12 +201,12 @@ async def interactive_mode(uri):
                     if user_input.strip():
                         # Try to parse as JSON, if not, wrap in echo message
                         try:
-                            json.loads(user_input)
+                            orjson.loads(user_input)
                             await websocket.send(user_input)
-                        except json.JSONDecodeError:
+                        except orjson.JSONDecodeError:
                             # Wrap in echo message
                             echo_msg = {"type": "echo", "message": user_input}
-                            await websocket.send(json.dumps(echo_msg))
+                            await websocket.send(orjson.dumps(echo_msg), text=True)
                             
                 except KeyboardInterrupt:
                     break
@@ -7,8 +7,11 @@ It demonstrates real-time bidirectional communication capabilities.
 """
 
 import asyncio
+import uvloop
 import websockets
-import json
+from websockets.frames import Frame, Opcode
+from websockets.protocol import State
+import orjson
 import logging
 import time
 from datetime import datetime
@@ -23,17 +26,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger('websocket_backend')
 
+# Maximum number of outbound frames buffered per client before dropping
+OUTBOX_SIZE = 256
+
+# Last formatted timestamp and the monotonic tick it was taken at
+_TS_CACHE = ['', float('-inf')]
+
+def now_iso():
+    """Return the current time in ISO format, reformatted at most once per millisecond"""
+    # Gate on the monotonic clock so wall-clock steps can't pin a stale value
+    tick = time.monotonic()
+    if tick - _TS_CACHE[1] > 0.001:
+        _TS_CACHE[0] = datetime.now().isoformat()
+        _TS_CACHE[1] = tick
+    return _TS_CACHE[0]
+
+def text_frame(payload):
+    """Serialize a payload into an unmasked server-side TEXT frame"""
+    return Frame(Opcode.TEXT, payload).serialize(mask=False)
+
 class WebSocketBackend:
     def __init__(self, host='localhost', port=3004):
         self.host = host
         self.port = port
-        self.clients = set()
+        self.clients = []
+        self.outboxes = {}
+        self.writers = {}
+        self.backed_up = set()
         self.message_count = 0
         self.start_time = time.time()
         
     async def register_client(self, websocket):
         """Register a new WebSocket client"""
-        self.clients.add(websocket)
+        self.clients.append(websocket)
+        self.outboxes[websocket] = asyncio.Queue(maxsize=OUTBOX_SIZE)
+        self.writers[websocket] = asyncio.create_task(self.client_writer(websocket))
         client_info = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
         logger.info(f"Client connected: {client_info} (Total: {len(self.clients)})")
         
@@ -47,75 +74,128 @@ class WebSocketBackend:
                 "uptime": time.time() - self.start_time,
                 "total_clients": len(self.clients)
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
-        await websocket.send(json.dumps(welcome_msg))
+        self.queue_message(websocket, orjson.dumps(welcome_msg))
         
     async def unregister_client(self, websocket):
         """Unregister a WebSocket client"""
-        self.clients.discard(websocket)
+        try:
+            self.clients.remove(websocket)
+        except ValueError:
+            pass
+        self.outboxes.pop(websocket, None)
+        self.backed_up.discard(websocket)
+        writer = self.writers.pop(websocket, None)
+        if writer:
+            writer.cancel()
         logger.info(f"Client disconnected (Total: {len(self.clients)})")
         
-    async def broadcast_message(self, message, sender=None):
+    def queue_message(self, websocket, message):
+        """Queue a message for the client's writer task"""
+        self.queue_frame(websocket, text_frame(message))
+        
+    def queue_frame(self, websocket, frame):
+        """Queue a pre-serialized frame, dropping it if the client is backed up"""
+        outbox = self.outboxes.get(websocket)
+        if outbox is None:
+            return
+        try:
+            outbox.put_nowait(frame)
+        except asyncio.QueueFull:
+            # Warn once per backlog rather than once per dropped frame
+            if websocket not in self.backed_up:
+                self.backed_up.add(websocket)
+                logger.warning("Outbox full, dropping messages for %s", websocket.remote_address)
+            
+    async def client_writer(self, websocket):
+        """Drain the client's outbox, coalescing queued messages into one write"""
+        outbox = self.outboxes[websocket]
+        try:
+            while True:
+                batch = [await outbox.get()]
+                try:
+                    while True:
+                        batch.append(outbox.get_nowait())
+                except asyncio.QueueEmpty:
+                    pass
+                # The outbox has room again; warn afresh if it fills up later
+                self.backed_up.discard(websocket)
+                
+                if websocket.state is not State.OPEN:
+                    return
+                websocket.transport.writelines(batch)
+                await websocket.drain()
+        except (websockets.exceptions.ConnectionClosed, OSError):
+            # The connection dropped while a drain was pending
+            pass
+            
+    def broadcast_frame(self, frame, recipients):
+        """Hand the same frame to every recipient's writer task"""
+        for client in recipients:
+            self.queue_frame(client, frame)
+            
+    def broadcast_message(self, message, sender=None):
         """Broadcast message to all connected clients"""
-        if self.clients:
+        # Send to all clients except sender, skipping all work if nobody else is connected
+        recipients = [client for client in self.clients if client is not sender]
+        if recipients:
             broadcast_data = {
                 "type": "broadcast",
                 "message": message,
                 "sender": str(sender.remote_address) if sender else "server",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
                 "total_clients": len(self.clients)
             }
             
-            # Send to all clients except sender
-            recipients = self.clients - {sender} if sender else self.clients
-            if recipients:
-                await asyncio.gather(
-                    *[client.send(json.dumps(broadcast_data)) for client in recipients],
-                    return_exceptions=True
-                )
+            # Serialize and frame once, then write the same bytes to every client
+            payload = orjson.dumps(broadcast_data)
+            frame = text_frame(payload)
+            self.broadcast_frame(frame, recipients)
                 
     async def handle_client_message(self, websocket, message):
         """Handle incoming message from client"""
+        # Every reply carries a timestamp, so look it up once per message
+        timestamp = now_iso()
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             msg_type = data.get('type', 'unknown')
             
             self.message_count += 1
-            logger.info(f"Received {msg_type} message from {websocket.remote_address}")
+            logger.debug("Received %s message from %s", msg_type, websocket.remote_address)
             
             if msg_type == 'ping':
                 # Respond to ping with pong
                 pong_response = {
                     "type": "pong",
                     "original_message": data,
-                    "server_time": datetime.now().isoformat(),
+                    "server_time": timestamp,
                     "message_count": self.message_count
                 }
-                await websocket.send(json.dumps(pong_response))
+                self.queue_message(websocket, orjson.dumps(pong_response))
                 
             elif msg_type == 'echo':
                 # Echo the message back
                 echo_response = {
                     "type": "echo_response",
                     "original_message": data.get('message', ''),
-                    "echoed_at": datetime.now().isoformat(),
+                    "echoed_at": timestamp,
                     "message_count": self.message_count
                 }
-                await websocket.send(json.dumps(echo_response))
+                self.queue_message(websocket, orjson.dumps(echo_response))
                 
             elif msg_type == 'broadcast':
                 # Broadcast message to all other clients
-                await self.broadcast_message(data.get('message', ''), sender=websocket)
+                self.broadcast_message(data.get('message', ''), sender=websocket)
                 
                 # Confirm broadcast to sender
                 confirm_response = {
                     "type": "broadcast_confirm",
                     "message": "Message broadcasted successfully",
                     "recipients": len(self.clients) - 1,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 }
-                await websocket.send(json.dumps(confirm_response))
+                self.queue_message(websocket, orjson.dumps(confirm_response))
                 
             elif msg_type == 'stats':
                 # Send server statistics
@@ -128,9 +208,9 @@ class WebSocketBackend:
                         "server_host": self.host,
                         "server_port": self.port
                     },
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 }
-                await websocket.send(json.dumps(stats_response))
+                self.queue_message(websocket, orjson.dumps(stats_response))
                 
             else:
                 # Unknown message type
@@ -138,35 +218,37 @@ class WebSocketBackend:
                     "type": "error",
                     "message": f"Unknown message type: {msg_type}",
                     "supported_types": ["ping", "echo", "broadcast", "stats"],
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 }
-                await websocket.send(json.dumps(error_response))
+                self.queue_message(websocket, orjson.dumps(error_response))
                 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # Handle invalid JSON
             error_response = {
                 "type": "error",
                 "message": "Invalid JSON format",
-                "received": message[:100],  # First 100 chars
-                "timestamp": datetime.now().isoformat()
+                "received": message[:100].decode(errors='replace'),  # First 100 bytes
+                "timestamp": timestamp
             }
-            await websocket.send(json.dumps(error_response))
+            self.queue_message(websocket, orjson.dumps(error_response))
             
         except Exception as e:
             logger.error(f"Error handling message: {e}")
             error_response = {
                 "type": "error",
                 "message": "Internal server error",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
-            await websocket.send(json.dumps(error_response))
+            self.queue_message(websocket, orjson.dumps(error_response))
             
     async def handle_client(self, websocket):
         """Handle WebSocket client connection"""
         await self.register_client(websocket)
         
         try:
-            async for message in websocket:
+            while True:
+                # Receive raw bytes; orjson validates UTF-8 while parsing
+                message = await websocket.recv(decode=False)
                 await self.handle_client_message(websocket, message)
         except websockets.exceptions.ConnectionClosed:
             logger.info("Client connection closed normally")
@@ -179,23 +261,23 @@ class WebSocketBackend:
         """Send periodic messages to all clients"""
         while True:
             await asyncio.sleep(30)  # Every 30 seconds
-            if self.clients:
+            client_count = len(self.clients)
+            if client_count:
                 periodic_msg = {
                     "type": "periodic_update",
                     "message": "Server heartbeat",
                     "server_stats": {
-                        "connected_clients": len(self.clients),
+                        "connected_clients": client_count,
                         "total_messages": self.message_count,
                         "uptime": time.time() - self.start_time
                     },
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now_iso()
                 }
                 
-                await asyncio.gather(
-                    *[client.send(json.dumps(periodic_msg)) for client in self.clients],
-                    return_exceptions=True
-                )
-                logger.info(f"Sent periodic update to {len(self.clients)} clients")
+                payload = orjson.dumps(periodic_msg)
+                frame = text_frame(payload)
+                self.broadcast_frame(frame, self.clients)
+                logger.info(f"Sent periodic update to {client_count} clients")
                 
     async def start_server(self):
         """Start the WebSocket server"""
@@ -210,7 +292,9 @@ class WebSocketBackend:
             self.host,
             self.port,
             ping_interval=20,
-            ping_timeout=10
+            ping_timeout=10,
+            compression=None,
+            max_size=2**20
         )
         
         logger.info(f"WebSocket server started on ws://{self.host}:{self.port}")
@@ -257,7 +341,7 @@ async def main():
 
 if __name__ == '__main__':
     try:
-        asyncio.run(main())
+        uvloop.run(main())
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
     except Exception as e: